@@ -367,8 +367,14 @@ def print_summary(values: dict[str, str], files_processed: int, target_path: Pat
     print(f"\n{Colors.GREEN}🎉 Your MCP service '{values['Service Name']}' is ready for development!{Colors.END}")
 
 
-def main():
-    """Main setup function"""
+def main(values: dict[str, str] | None = None):
+    """
+    Main setup function
+
+    Args:
+        values: Pre-filled answers (same keys prompt_for_values returns, including
+            "target_directory"). When given, setup runs without prompting.
+    """
     base_path = Path(__file__).parent.absolute()
 
     print_header()
@@ -385,7 +391,7 @@ def main():
     # Check if template has already been set up
     with open(pyproject_template_path) as f:
         content = f.read()
-        if "{{service_name}}" not in content:
+        if "{{service_name}}" not in content and values is None:
             print(f"{Colors.YELLOW}⚠️  This template appears to have already been set up.{Colors.END}")
             response = input("Do you want to continue anyway? (y/N): ").strip().lower()
             if response != "y":
@@ -393,7 +399,8 @@ def main():
                 sys.exit(0)
 
     # Get configuration values
-    values = prompt_for_values()
+    if values is None:
+        values = prompt_for_values()
     target_path = Path(values["target_directory"])
 
     print(f"\n{Colors.BOLD}🔄 Creating Project...{Colors.END}\n")
@@ -23,6 +23,8 @@ class Config:
 
     # SQLite Database
     # DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///data.db")
+    # Comma-separated loadable extensions (e.g. sqlean) loaded into every pooled connection
+    SQLITE_EXTENSIONS: list[str] = [ext.strip() for ext in os.getenv("SQLITE_EXTENSIONS", "").split(",") if ext.strip()]
 
     # External APIs
     # API_BASE_URL: str = os.getenv("API_BASE_URL", "")
@@ -47,6 +49,8 @@ class Config:
     # Performance settings
     MAX_QUERY_TIMEOUT: int = int(os.getenv("MAX_QUERY_TIMEOUT", "300"))  # seconds
     MAX_RESULTS_PER_QUERY: int = int(os.getenv("MAX_RESULTS_PER_QUERY", "10000"))
+    SQLITE_POOL_SIZE: int = int(os.getenv("SQLITE_POOL_SIZE", "8"))  # connections per database file
+    SQLITE_POOL_MAX_OVERFLOW: int = int(os.getenv("SQLITE_POOL_MAX_OVERFLOW", "8"))  # short-lived extras under load
 
     @classmethod
     def validate(cls) -> None:
@@ -12,37 +12,384 @@ Key Patterns Demonstrated:
 - Caching patterns for API responses
 """
 
+import functools
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from types import TracebackType
 from typing import Any
+from urllib.parse import urlsplit
 
+import ijson
+import orjson
 import requests
-
-# from ..common.config import Config  # TODO: Remove if not using config
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import ConnectionPool
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from ..common.config import Config
 from ..common.logging import get_logger
 from ..mcp_instance import mcp
 
 logger = get_logger(__name__)
 
-# Global session for connection reuse
-_session = None
+# One session per thread: each keeps its own keep-alive pool, so concurrent tool
+# calls don't contend on a single shared connection pool lock
+_thread_local = threading.local()
+
+# Shared pool for fanning out independent lookups (e.g. the country search endpoints)
+_lookup_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rest-lookup")
+
+# Headers sent with every request on the shared session
+_DEFAULT_HEADERS = {
+    "User-Agent": "MCP-Service-Template/1.0",
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+    # Advertise every encoding urllib3 can decode here (br/zstd when brotli/zstandard are installed)
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Accepted values for tool arguments
+_VALID_RESOURCES = frozenset({"posts", "comments", "albums", "photos", "todos", "users"})
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"})
+
+# JSONPlaceholder API - free fake REST API for testing
+PLACEHOLDER_BASE_URL = "https://jsonplaceholder.typicode.com"
+
+# REST Countries API - free and doesn't require API key
+COUNTRY_BASE_URL = "https://restcountries.com/v3.1"
+
+# Country search endpoints, in priority order
+_COUNTRY_SEARCH_PREFIXES = ("name/", "alpha/", "capital/")
+
+# Content types whose bodies are a sequence of JSON documents, one per line
+_JSON_STREAM_CONTENT_TYPES = frozenset(
+    {"text/event-stream", "application/x-ndjson", "application/ndjson", "application/jsonl"}
+)
+
+# Last formatted timestamp and the monotonic time it was taken, reused by _now_iso()
+_timestamp_cache: list[Any] = ["", float("-inf")]
+
+# Per-host client-side rate limiters, shared across the per-thread sessions
+_rate_limiters: dict[str, "TokenBucket"] = {}
+_rate_limiters_lock = threading.Lock()
+
+# Transient failures worth retrying: rate limiting and gateway/upstream hiccups
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Longest Retry-After (seconds) waited out inside a tool call; longer waits go back to the caller
+MAX_RETRY_AFTER = 5.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to upstream congestion.
+
+    Callers take a token before each request and sleep when the bucket is empty.
+    The rate is cut multiplicatively when the server throttles us and grows back
+    slowly on success, so requests get paced below the server's limit instead of
+    hitting it and reacting to 429s after the fact.
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.5, max_rate: float = 20.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (possibly going negative) so waiters queue fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def shrink(self, factor: float) -> None:
+        """Slow down after being throttled"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * factor)
+
+    def grow(self, factor: float) -> None:
+        """Speed back up after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * factor)
+
+
+def _get_rate_limiter(host: str) -> TokenBucket:
+    """Get the token bucket shared by every session for this host"""
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(host)
+        if bucket is None:
+            bucket = _rate_limiters[host] = TokenBucket(rate=5, capacity=10)
+        return bucket
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP adapter that paces requests per host with an adaptive token bucket.
+
+    Each send() takes one token. Retries that urllib3 makes inside that send are
+    not paced by the bucket; they wait on the retry backoff and the capped
+    Retry-After instead. 429s among them still shrink the host's rate.
+    """
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        bucket = _get_rate_limiter(urlsplit(request.url or "").netloc)
+        bucket.acquire()
+        response = super().send(request, *args, **kwargs)
+
+        # 429s absorbed by urllib3's retries still count as congestion signals
+        retries = getattr(response.raw, "retries", None)
+        history = retries.history if retries is not None else ()
+        if response.status_code == 429 or any(attempt.status == 429 for attempt in history):
+            bucket.shrink(0.5)
+        elif response.ok:
+            bucket.grow(1.05)
+        return response
+
+
+class _CappedRetry(Retry):
+    """Retry policy that won't let a server's Retry-After stall a tool call for long"""
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        _pool: ConnectionPool | None = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> "_CappedRetry":
+        if response is not None:
+            retry_after = super().get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                # Give up now; with raise_on_status=False urllib3 returns this response as is
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:g}s exceeds the cap"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def _build_http_adapter() -> HTTPAdapter:
+    """Build a rate-limited HTTP adapter that retries transient failures with exponential backoff"""
+    retry = _CappedRetry(
+        total=5,
+        backoff_factor=0.5,
+        # Randomize each backoff so concurrent clients don't retry in lockstep
+        backoff_jitter=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        # Only retry idempotent methods; replaying a POST could duplicate side effects
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        # Hand the final response back to the caller instead of raising RetryError
+        raise_on_status=False,
+    )
+    return RateLimitedAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
 
 
 def get_http_session() -> requests.Session:
-    """Get cached HTTP session with default configuration"""
-    global _session
-    if _session is None:
-        _session = requests.Session()
-        _session.headers.update(
-            {"User-Agent": "MCP-Service-Template/1.0", "Accept": "application/json", "Content-Type": "application/json"}
-        )
+    """Get this thread's cached HTTP session with default configuration"""
+    session: requests.Session | None = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(_DEFAULT_HEADERS)
         # Set reasonable timeouts
-        _session.timeout = 30
+        session.timeout = 30  # type: ignore[attr-defined]
+
+        # Retry 429/5xx responses, honoring the server's Retry-After header up to MAX_RETRY_AFTER
+        adapter = _build_http_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
         logger.info("Created new HTTP session")
 
-    return _session
+    return session
+
+
+def _session_get(url: str, **kwargs: Any) -> requests.Response:
+    """GET using the calling thread's session, for work submitted to an executor"""
+    return get_http_session().get(url, **kwargs)
+
+
+def _error(code: str, message: str, **extra: Any) -> dict[str, Any]:
+    """
+    Build an error result with a stable machine-readable code.
+
+    Args:
+        code: Stable error category (e.g. "invalid_argument", "upstream_error")
+        message: Human-readable description
+        **extra: Additional context such as suggestions or valid values
+
+    Returns:
+        Error dictionary with "error", "code" and any extra fields
+    """
+    return {"error": message, "code": code, **extra}
+
+
+def _is_json_stream(response: requests.Response) -> bool:
+    """Whether the response is line-delimited JSON (NDJSON, JSON Lines or server-sent events)"""
+    content_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    return content_type in _JSON_STREAM_CONTENT_TYPES
+
+
+def _parse_json_lines(body: bytes) -> list[Any]:
+    """
+    Parse a line-delimited JSON body into a list of documents.
+
+    Handles both bare NDJSON lines and server-sent event ``data:`` lines. Blank lines,
+    SSE comments and non-data fields (event:, id:, retry:) and the ``[DONE]``
+    sentinel are skipped.
+
+    Args:
+        body: Raw response body
+
+    Returns:
+        List of decoded JSON documents in arrival order
+    """
+    items = []
+    for raw_line in body.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(b":"):
+            continue
+        if line.startswith(b"data:"):
+            line = line[5:].strip()
+        elif line.startswith((b"event:", b"id:", b"retry:")):
+            continue
+        if line and line != b"[DONE]":
+            items.append(orjson.loads(line))
+    return items
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, recomputed at most every 50ms"""
+    now = time.monotonic()
+    if now - _timestamp_cache[1] > 0.05:
+        _timestamp_cache[0] = datetime.now().isoformat()
+        _timestamp_cache[1] = now
+    return _timestamp_cache[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _build_url(base_url: str, endpoint: str) -> str:
+    """Join a base URL and endpoint with exactly one slash between them"""
+    return f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+def _fast_json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson, skipping requests' slower json path"""
+    return orjson.loads(response.content)
+
+
+def ttl_cached(ttl: float, maxsize: int = 1024) -> Callable:
+    """
+    Cache successful tool results in-process for ``ttl`` seconds.
+
+    Results are keyed by the call arguments. Error responses are never cached so a
+    transient failure doesn't stick around, and caching is skipped entirely when
+    ``Config.ENABLE_CACHING`` is off.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+        maxsize: Maximum number of distinct argument combinations to keep
+
+    Returns:
+        Decorator that adds the cache and a ``cache_clear()`` helper to the function
+    """
+
+    def decorator(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            if not Config.ENABLE_CACHING:
+                return func(*args, **kwargs)
+
+            key = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                hit = cache.get(key)
+            if hit is not None:
+                logger.debug(f"Cache hit for {func.__name__}{args}")
+                return hit
+
+            result = func(*args, **kwargs)
+            if "error" not in result:
+                with lock:
+                    cache[key] = result
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def single_flight(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """
+    Coalesce concurrent identical calls into a single upstream request.
+
+    The first caller for a given set of arguments runs the function; callers that
+    arrive while it is still in flight wait on the same Future and share its result.
+
+    Args:
+        func: Tool function to wrap
+
+    Returns:
+        Wrapped function
+    """
+    inflight: dict[tuple, Future] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        key = (args, tuple(sorted(kwargs.items())))
+        with lock:
+            future = inflight.get(key)
+            owner = future is None
+            if owner:
+                future = inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with lock:
+                del inflight[key]
+
+    return wrapper
 
 
 @mcp.tool(description="Get current weather data from a free weather API")
+@ttl_cached(ttl=60)
+@single_flight
 def get_weather_data(city: str, country_code: str | None = None, units: str = "metric") -> dict[str, Any]:
     """
     Get current weather data for a city using OpenWeatherMap free API.
@@ -77,7 +424,7 @@ def get_weather_data(city: str, country_code: str | None = None, units: str = "m
         response = session.get(url, params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        data = _fast_json(response)
 
         # Extract and format key weather information
         current = data.get("current_condition", [{}])[0]
@@ -95,7 +442,7 @@ def get_weather_data(city: str, country_code: str | None = None, units: str = "m
             },
             "metadata": {
                 "source": "wttr.in",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "units": "metric" if units == "metric" else "imperial",
             },
         }
@@ -105,14 +452,92 @@ def get_weather_data(city: str, country_code: str | None = None, units: str = "m
 
     except requests.exceptions.RequestException as e:
         logger.error(f"HTTP request error: {str(e)}")
-        return {
-            "error": f"Failed to fetch weather data: {str(e)}",
-            "location": location,
-            "suggestion": "Check internet connection and city name",
-        }
+        return _error(
+            "upstream_error",
+            f"Failed to fetch weather data: {str(e)}",
+            location=location,
+            suggestion="Check internet connection and city name",
+        )
     except Exception as e:
         logger.error(f"Unexpected error fetching weather data: {str(e)}")
-        return {"error": f"Unexpected error: {str(e)}", "location": location}
+        return _error("unexpected_error", f"Unexpected error: {str(e)}", location=location)
+
+
+def _fetch_quote(session: requests.Session) -> dict[str, Any]:
+    """Fetch a random quote from quotable.io"""
+    response = session.get("https://api.quotable.io/random", timeout=10)
+    response.raise_for_status()
+    data = _fast_json(response)
+
+    return {
+        "type": "quote",
+        "content": data.get("content", ""),
+        "author": data.get("author", "Unknown"),
+        "tags": data.get("tags", []),
+        "length": data.get("length", 0),
+        "source": "quotable.io",
+        "timestamp": _now_iso(),
+    }
+
+
+def _fetch_fact(session: requests.Session) -> dict[str, Any]:
+    """Fetch a random fact from uselessfacts.jsph.pl"""
+    response = session.get("https://uselessfacts.jsph.pl/random.json?language=en", timeout=10)
+    response.raise_for_status()
+    data = _fast_json(response)
+
+    return {
+        "type": "fact",
+        "content": data.get("text", ""),
+        "source": data.get("source", ""),
+        "source_url": data.get("source_url", ""),
+        "language": data.get("language", "en"),
+        "permalink": data.get("permalink", ""),
+        "api_source": "uselessfacts.jsph.pl",
+        "timestamp": _now_iso(),
+    }
+
+
+def _fetch_joke(session: requests.Session) -> dict[str, Any]:
+    """Fetch a random joke from official-joke-api"""
+    response = session.get("https://official-joke-api.appspot.com/random_joke", timeout=10)
+    response.raise_for_status()
+    data = _fast_json(response)
+
+    return {
+        "type": "joke",
+        "setup": data.get("setup", ""),
+        "punchline": data.get("punchline", ""),
+        "joke_type": data.get("type", "general"),
+        "id": data.get("id", ""),
+        "source": "official-joke-api.appspot.com",
+        "timestamp": _now_iso(),
+    }
+
+
+def _fetch_advice(session: requests.Session) -> dict[str, Any]:
+    """Fetch a random piece of advice from adviceslip.com"""
+    response = session.get("https://api.adviceslip.com/advice", timeout=10)
+    response.raise_for_status()
+    data = _fast_json(response)
+
+    slip = data.get("slip", {})
+    return {
+        "type": "advice",
+        "content": slip.get("advice", ""),
+        "advice_id": slip.get("id", ""),
+        "source": "adviceslip.com",
+        "timestamp": _now_iso(),
+    }
+
+
+# Content type -> fetcher; also the list of supported types reported on errors
+_CONTENT_HANDLERS: dict[str, Callable[[requests.Session], dict[str, Any]]] = {
+    "quote": _fetch_quote,
+    "fact": _fetch_fact,
+    "joke": _fetch_joke,
+    "advice": _fetch_advice,
+}
 
 
 @mcp.tool(description="Get random quotes or facts from free APIs")
@@ -126,95 +551,32 @@ def get_random_content(content_type: str = "quote") -> dict[str, Any]:
     Returns:
         Dictionary containing random content and metadata
     """
-    try:
-        session = get_http_session()
-
-        if content_type == "quote":
-            # Use quotable.io for quotes
-            url = "https://api.quotable.io/random"
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            return {
-                "type": "quote",
-                "content": data.get("content", ""),
-                "author": data.get("author", "Unknown"),
-                "tags": data.get("tags", []),
-                "length": data.get("length", 0),
-                "source": "quotable.io",
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        elif content_type == "fact":
-            # Use uselessfacts.jsph.pl for facts
-            url = "https://uselessfacts.jsph.pl/random.json?language=en"
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            return {
-                "type": "fact",
-                "content": data.get("text", ""),
-                "source": data.get("source", ""),
-                "source_url": data.get("source_url", ""),
-                "language": data.get("language", "en"),
-                "permalink": data.get("permalink", ""),
-                "api_source": "uselessfacts.jsph.pl",
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        elif content_type == "joke":
-            # Use official-joke-api for jokes
-            url = "https://official-joke-api.appspot.com/random_joke"
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            return {
-                "type": "joke",
-                "setup": data.get("setup", ""),
-                "punchline": data.get("punchline", ""),
-                "joke_type": data.get("type", "general"),
-                "id": data.get("id", ""),
-                "source": "official-joke-api.appspot.com",
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        elif content_type == "advice":
-            # Use adviceslip.com for advice
-            url = "https://api.adviceslip.com/advice"
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            slip = data.get("slip", {})
-            return {
-                "type": "advice",
-                "content": slip.get("advice", ""),
-                "advice_id": slip.get("id", ""),
-                "source": "adviceslip.com",
-                "timestamp": datetime.now().isoformat(),
-            }
+    handler = _CONTENT_HANDLERS.get(content_type)
+    if handler is None:
+        return _error(
+            "invalid_argument",
+            f"Unknown content type: {content_type}",
+            supported_types=list(_CONTENT_HANDLERS),
+        )
 
-        else:
-            return {
-                "error": f"Unknown content type: {content_type}",
-                "supported_types": ["quote", "fact", "joke", "advice"],
-            }
+    try:
+        return handler(get_http_session())
 
     except requests.exceptions.RequestException as e:
         logger.error(f"HTTP request error: {str(e)}")
-        return {
-            "error": f"Failed to fetch {content_type}: {str(e)}",
-            "suggestion": "Check internet connection and try again",
-        }
+        return _error(
+            "upstream_error",
+            f"Failed to fetch {content_type}: {str(e)}",
+            suggestion="Check internet connection and try again",
+        )
     except Exception as e:
         logger.error(f"Unexpected error fetching {content_type}: {str(e)}")
-        return {"error": f"Unexpected error: {str(e)}"}
+        return _error("unexpected_error", f"Unexpected error: {str(e)}")
 
 
 @mcp.tool(description="Get information about countries using REST Countries API")
+@ttl_cached(ttl=86400)
+@single_flight
 def get_country_info(country: str, info_type: str = "basic") -> dict[str, Any]:
     """
     Get detailed information about a country using the REST Countries API.
@@ -227,29 +589,31 @@ def get_country_info(country: str, info_type: str = "basic") -> dict[str, Any]:
         Dictionary containing country information
     """
     try:
-        session = get_http_session()
-
-        # REST Countries API - free and doesn't require API key
-        base_url = "https://restcountries.com/v3.1"
-
         # Try different search methods
-        search_urls = [f"{base_url}/name/{country}", f"{base_url}/alpha/{country}", f"{base_url}/capital/{country}"]
+        search_urls = [_build_url(COUNTRY_BASE_URL, prefix + country) for prefix in _COUNTRY_SEARCH_PREFIXES]
 
+        # Fire all lookups at once so a miss on /name doesn't cost an extra round trip.
+        # Results are still checked in priority order so the answer doesn't depend on
+        # which endpoint happens to respond first.
+        futures = [_lookup_executor.submit(_session_get, url, timeout=10) for url in search_urls]
         data = None
-        for url in search_urls:
+        for future in futures:
             try:
-                response = session.get(url, timeout=10)
+                response = future.result()
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _fast_json(response)
                     break
             except Exception:
                 continue
+        for future in futures:
+            future.cancel()
 
         if not data:
-            return {
-                "error": f"Country '{country}' not found",
-                "suggestion": "Try using the official country name, 2-letter code, or capital city",
-            }
+            return _error(
+                "not_found",
+                f"Country '{country}' not found",
+                suggestion="Try using the official country name, 2-letter code, or capital city",
+            )
 
         # Get the first country from results
         country_data = data[0] if isinstance(data, list) else data
@@ -311,14 +675,15 @@ def get_country_info(country: str, info_type: str = "basic") -> dict[str, Any]:
                 "language_count": len(country_data.get("languages", {})),
             }
         else:
-            return {
-                "error": f"Unknown info type: {info_type}",
-                "supported_types": ["basic", "detailed", "currency", "languages"],
-            }
+            return _error(
+                "invalid_argument",
+                f"Unknown info type: {info_type}",
+                supported_types=["basic", "detailed", "currency", "languages"],
+            )
 
         result["metadata"] = {
             "source": "restcountries.com",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "query": country,
             "info_type": info_type,
         }
@@ -328,13 +693,15 @@ def get_country_info(country: str, info_type: str = "basic") -> dict[str, Any]:
 
     except requests.exceptions.RequestException as e:
         logger.error(f"HTTP request error: {str(e)}")
-        return {"error": f"Failed to fetch country info: {str(e)}", "country": country}
+        return _error("upstream_error", f"Failed to fetch country info: {str(e)}", country=country)
     except Exception as e:
         logger.error(f"Unexpected error fetching country info: {str(e)}")
-        return {"error": f"Unexpected error: {str(e)}"}
+        return _error("unexpected_error", f"Unexpected error: {str(e)}")
 
 
 @mcp.tool(description="Get JSON placeholder data for testing and development")
+@ttl_cached(ttl=300)
+@single_flight
 def get_placeholder_data(resource: str = "posts", item_id: int | None = None, limit: int = 10) -> dict[str, Any]:
     """
     Get placeholder data from JSONPlaceholder for testing purposes.
@@ -350,27 +717,24 @@ def get_placeholder_data(resource: str = "posts", item_id: int | None = None, li
     try:
         session = get_http_session()
 
-        # JSONPlaceholder API - free fake REST API for testing
-        base_url = "https://jsonplaceholder.typicode.com"
-
         # Validate resource type
-        valid_resources = ["posts", "comments", "albums", "photos", "todos", "users"]
-        if resource not in valid_resources:
-            return {"error": f"Invalid resource: {resource}", "valid_resources": valid_resources}
+        if resource not in _VALID_RESOURCES:
+            return _error("invalid_argument", f"Invalid resource: {resource}", valid_resources=sorted(_VALID_RESOURCES))
 
-        # Build URL
         if item_id:
-            url = f"{base_url}/{resource}/{item_id}"
+            response = session.get(_build_url(PLACEHOLDER_BASE_URL, f"{resource}/{item_id}"), timeout=10)
+            response.raise_for_status()
+            data = _fast_json(response)
         else:
-            url = f"{base_url}/{resource}"
-
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        # Apply limit for collections
-        if isinstance(data, list) and not item_id:
-            data = data[:limit]
+            # Collections can be thousands of items; stream them and stop parsing once
+            # the limit is reached instead of buffering the whole payload
+            response = session.get(_build_url(PLACEHOLDER_BASE_URL, resource), timeout=10, stream=True)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                data = list(itertools.islice(ijson.items(response.raw, "item", use_float=True), limit))
+            finally:
+                response.close()
 
         result = {
             "resource": resource,
@@ -378,7 +742,7 @@ def get_placeholder_data(resource: str = "posts", item_id: int | None = None, li
             "count": len(data) if isinstance(data, list) else 1,
             "metadata": {
                 "source": "jsonplaceholder.typicode.com",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "item_id": item_id,
                 "limit_applied": limit if isinstance(data, list) and not item_id else None,
             },
@@ -389,10 +753,10 @@ def get_placeholder_data(resource: str = "posts", item_id: int | None = None, li
 
     except requests.exceptions.RequestException as e:
         logger.error(f"HTTP request error: {str(e)}")
-        return {"error": f"Failed to fetch placeholder data: {str(e)}", "resource": resource}
+        return _error("upstream_error", f"Failed to fetch placeholder data: {str(e)}", resource=resource)
     except Exception as e:
         logger.error(f"Unexpected error fetching placeholder data: {str(e)}")
-        return {"error": f"Unexpected error: {str(e)}"}
+        return _error("unexpected_error", f"Unexpected error: {str(e)}")
 
 
 @mcp.tool(description="Make custom HTTP request to any public API")
@@ -403,6 +767,7 @@ def make_http_request(
     params: dict[str, Any] | None = None,
     data: dict[str, Any] | None = None,
     timeout: int = 30,
+    include_headers: bool = False,
 ) -> dict[str, Any]:
     """
     Make a custom HTTP request to any public API.
@@ -414,6 +779,7 @@ def make_http_request(
         params: URL parameters
         data: Request body data (for POST, PUT, etc.)
         timeout: Request timeout in seconds
+        include_headers: Include request and response headers in the result
 
     Returns:
         Dictionary containing response data and metadata
@@ -422,9 +788,8 @@ def make_http_request(
         session = get_http_session()
 
         # Validate method
-        valid_methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-        if method.upper() not in valid_methods:
-            return {"error": f"Invalid HTTP method: {method}", "valid_methods": valid_methods}
+        if method.upper() not in _VALID_METHODS:
+            return _error("invalid_argument", f"Invalid HTTP method: {method}", valid_methods=sorted(_VALID_METHODS))
 
         # Prepare request arguments
         request_kwargs = {
@@ -449,25 +814,33 @@ def make_http_request(
             "request": {
                 "url": url,
                 "method": method.upper(),
-                "headers": dict(response.request.headers),
                 "params": params,
                 "data": data,
             },
             "response": {
                 "status_code": response.status_code,
                 "status": "success" if response.ok else "error",
-                "headers": dict(response.headers),
                 "encoding": response.encoding,
                 "size_bytes": len(response.content),
             },
-            "metadata": {"timestamp": datetime.now().isoformat(), "elapsed_seconds": response.elapsed.total_seconds()},
+            "metadata": {"timestamp": _now_iso(), "elapsed_seconds": response.elapsed.total_seconds()},
         }
 
+        # Copying the header mappings is pure overhead for most callers, so it's opt-in
+        if include_headers:
+            result["request"]["headers"] = dict(response.request.headers)
+            result["response"]["headers"] = dict(response.headers)
+
         # Add response content
         try:
-            # Try to parse as JSON
-            result["response"]["data"] = response.json()
-            result["response"]["content_type"] = "json"
+            if _is_json_stream(response):
+                # NDJSON/SSE bodies hold one JSON document per line, not a single document
+                result["response"]["data"] = _parse_json_lines(response.content)
+                result["response"]["content_type"] = "json_lines"
+            else:
+                # Try to parse as JSON
+                result["response"]["data"] = _fast_json(response)
+                result["response"]["content_type"] = "json"
         except Exception:
             # Fall back to text
             result["response"]["data"] = response.text
@@ -481,7 +854,7 @@ def make_http_request(
 
     except requests.exceptions.RequestException as e:
         logger.error(f"HTTP request error: {str(e)}")
-        return {"error": f"Request failed: {str(e)}", "request": {"url": url, "method": method}}
+        return _error("upstream_error", f"Request failed: {str(e)}", request={"url": url, "method": method})
     except Exception as e:
         logger.error(f"Unexpected error making HTTP request: {str(e)}")
-        return {"error": f"Unexpected error: {str(e)}"}
+        return _error("unexpected_error", f"Unexpected error: {str(e)}")
@@ -1,15 +1,79 @@
+import functools
+import importlib
 import sys
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp import types
 
 from service_name_mcp import __version__
 from service_name_mcp.common.logging import logger
 from service_name_mcp.mcp_instance import mcp
 
-# Import tool modules to register them with the MCP server
-# The @mcp.tool and @mcp.prompt decorators will execute during import, registering tools
+# Tool modules to register with the MCP server, relative to this package
+# The @mcp.tool and @mcp.prompt decorators execute during import, registering tools.
+# Imports are deferred until a client first lists or calls tools/prompts/resources, so
+# startup doesn't pay for every domain's dependencies before the transport is up.
 # TODO: Replace these with your actual domain modules
+DOMAIN_MODULES: tuple[str, ...] = (
+    # "sqlite_domain.sqlite_tools",
+    # "rest_api_domain.rest_api_tools",
+    # "file_processing_domain.file_processing_tools",
+)
+
+# Requests that need the full tool/prompt/resource registry to answer
+_REGISTRY_REQUESTS = (
+    types.ListToolsRequest,
+    types.CallToolRequest,
+    types.ListPromptsRequest,
+    types.GetPromptRequest,
+    types.ListResourcesRequest,
+    types.ReadResourceRequest,
+    types.ListResourceTemplatesRequest,
+)
+
+_domains_registered = False
+
+
+def _register_domains() -> None:
+    """Import every domain module once so its tools and prompts are registered"""
+    global _domains_registered
+    if _domains_registered:
+        return
+    for module in DOMAIN_MODULES:
+        importlib.import_module(f".{module}", __package__)
+    _domains_registered = True
+    logger.info(f"Registered {len(DOMAIN_MODULES)} domain module(s)")
+
+
+def _with_domains(handler: Callable[[Any], Awaitable[Any]]) -> Callable[[Any], Awaitable[Any]]:
+    """Wrap a request handler so domain modules are registered before it runs"""
+
+    @functools.wraps(handler)
+    async def wrapper(request: Any) -> Any:
+        _register_domains()
+        return await handler(request)
+
+    return wrapper
+
+
+def _install_lazy_registration() -> None:
+    """Register domain modules on first use instead of at import time"""
+    handlers = mcp._mcp_server.request_handlers
+    for request_type in _REGISTRY_REQUESTS:
+        handler = handlers.get(request_type)
+        if handler is not None:
+            handlers[request_type] = _with_domains(handler)
+
+
+_install_lazy_registration()
 
 
 def main() -> None:
+    # Tools spend most of their time in short blocking I/O calls on worker threads;
+    # a shorter GIL switch interval lets those threads hand off sooner
+    sys.setswitchinterval(0.001)
+
     # writing to stderr because stdout is used for the transport
     # and we want to see the logs in the console
     logger.error("Starting {{service_name}} MCP server")
@@ -13,9 +13,25 @@ Key Patterns Demonstrated:
 - Data sampling and exploration
 """
 
+import atexit
+import base64
+import copy
+import functools
+import importlib.util
+import io
 import os
+import queue
+import re
 import sqlite3
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, closing, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Literal
+
+from cachetools import TTLCache
 
 from ..common.config import Config
 from ..common.logging import get_logger
@@ -23,89 +39,570 @@ from ..mcp_instance import mcp
 
 logger = get_logger(__name__)
 
-# Global connection cache
-_connection_cache = {}
+# Applied to every pooled connection: WAL lets readers run alongside a writer, and
+# busy_timeout makes writers wait for a lock instead of failing immediately
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Tuning for one-off bulk loads: WAL with relaxed fsync, temp data in memory and a 64MB page cache
+_BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Prepared statements kept per connection; table schemas are cached to match
+_STATEMENT_CACHE_SIZE = 256
+
+# Rows pulled from the cursor per fetchmany() call when reading query results
+_FETCH_BATCH_SIZE = 1000
+
+# Upper bound on parameter rows accepted by sqlite_execute_many in one call
+_MAX_BATCH_ROWS = 100_000
+
+# SQLite's default SQLITE_MAX_COMPOUND_SELECT: most SELECTs one UNION ALL may chain
+_MAX_COMPOUND_SELECT = 500
+
+# Rows per record batch when writing Arrow IPC streams
+_ARROW_BATCH_SIZE = 4096
+
+# Demo e-commerce schema created by sqlite_create_sample_database
+_SAMPLE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS customers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        city TEXT,
+        signup_date DATE,
+        is_active BOOLEAN DEFAULT 1
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        category TEXT,
+        price DECIMAL(10,2),
+        stock_quantity INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_id INTEGER,
+        order_date DATE,
+        total_amount DECIMAL(10,2),
+        status TEXT DEFAULT 'pending',
+        FOREIGN KEY (customer_id) REFERENCES customers (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS order_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id INTEGER,
+        product_id INTEGER,
+        quantity INTEGER,
+        unit_price DECIMAL(10,2),
+        FOREIGN KEY (order_id) REFERENCES orders (id),
+        FOREIGN KEY (product_id) REFERENCES products (id)
+    )
+    """,
+)
+
+# Demo rows inserted by sqlite_create_sample_database: one prepared INSERT per table
+# plus its parameter rows, loaded with executemany()
+_SAMPLE_DATA: tuple[tuple[str, tuple[tuple[Any, ...], ...]], ...] = (
+    (
+        "INSERT OR REPLACE INTO customers (name, email, city, signup_date) VALUES (?, ?, ?, ?)",
+        (
+            ("Alice Johnson", "alice@example.com", "New York", "2024-01-15"),
+            ("Bob Smith", "bob@example.com", "Los Angeles", "2024-02-20"),
+            ("Carol Davis", "carol@example.com", "Chicago", "2024-03-10"),
+            ("David Wilson", "david@example.com", "Houston", "2024-04-05"),
+            ("Eva Brown", "eva@example.com", "Phoenix", "2024-05-12"),
+        ),
+    ),
+    (
+        "INSERT OR REPLACE INTO products (name, category, price, stock_quantity) VALUES (?, ?, ?, ?)",
+        (
+            ("Laptop Pro", "Electronics", 1299.99, 50),
+            ("Wireless Mouse", "Electronics", 29.99, 200),
+            ("Office Chair", "Furniture", 249.99, 30),
+            ("Coffee Mug", "Kitchen", 12.99, 100),
+            ("Notebook Set", "Office", 15.99, 150),
+        ),
+    ),
+    (
+        "INSERT OR REPLACE INTO orders (customer_id, order_date, total_amount, status) VALUES (?, ?, ?, ?)",
+        (
+            (1, "2024-06-01", 1329.98, "completed"),
+            (2, "2024-06-05", 29.99, "completed"),
+            (3, "2024-06-10", 262.98, "shipped"),
+            (4, "2024-06-15", 28.98, "pending"),
+            (1, "2024-06-20", 15.99, "completed"),
+        ),
+    ),
+    (
+        "INSERT OR REPLACE INTO order_items (order_id, product_id, quantity, unit_price) VALUES (?, ?, ?, ?)",
+        (
+            (1, 1, 1, 1299.99),
+            (1, 2, 1, 29.99),
+            (2, 2, 1, 29.99),
+            (3, 3, 1, 249.99),
+            (3, 5, 1, 12.99),
+            (4, 4, 2, 12.99),
+            (4, 5, 1, 15.99),
+            (5, 5, 1, 15.99),
+        ),
+    ),
+)
+
+
+# Database paths recently confirmed to exist. Only hits are cached, so a database created
+# after a "not found" answer is picked up on the next call.
+_existing_paths: TTLCache = TTLCache(maxsize=32, ttl=5)
+_existing_paths_lock = threading.Lock()
+
+
+def _db_exists(db_path: str) -> bool:
+    """os.path.exists() for database files, skipping the stat() for paths seen in the last few seconds"""
+    with _existing_paths_lock:
+        if db_path in _existing_paths:
+            return True
+    if not os.path.exists(db_path):
+        return False
+    with _existing_paths_lock:
+        _existing_paths[db_path] = True
+    return True
+
+
+def _forget_db_path(db_path: str) -> None:
+    """Drop a cached existence answer, e.g. after the file turned out to be gone"""
+    with _existing_paths_lock:
+        _existing_paths.pop(db_path, None)
+
+
+def _quote_ident(name: str) -> str:
+    """Quote an SQL identifier (table or column name) for safe interpolation"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _count_rows(cursor: sqlite3.Cursor, table_names: list[str]) -> dict[str, int]:
+    """Count rows in many tables with one UNION ALL query per chunk instead of one query per table"""
+    counts: dict[str, int] = {}
+    for start in range(0, len(table_names), _MAX_COMPOUND_SELECT):
+        chunk = table_names[start : start + _MAX_COMPOUND_SELECT]
+        query = " UNION ALL ".join(f"SELECT ?, COUNT(*) FROM {_quote_ident(name)}" for name in chunk)
+        counts.update(cursor.execute(query, chunk).fetchall())
+    return counts
+
+
+def _fetch_columnar(cursor: sqlite3.Cursor, query: str, parameters: tuple[Any, ...]) -> dict[str, list[Any]]:
+    """Run a query and return its result as one list of values per column"""
+    rows = cursor.execute(query, parameters).fetchall()
+    names = [desc[0] for desc in cursor.description]
+    return dict(zip(names, map(list, zip(*rows, strict=True)), strict=True)) if rows else {name: [] for name in names}
+
+
+def _encode_columnar(columns: list[str], rows: list[list[Any]], format: str) -> str:
+    """Pack result rows into an Arrow IPC stream or Parquet file and return it base64-encoded"""
+    import pyarrow as pa
+
+    values = list(zip(*rows, strict=True)) if rows else [()] * len(columns)
+    table = pa.table([pa.array(column) for column in values], names=columns)
+    buffer = io.BytesIO()
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, buffer)
+    else:
+        with pa.ipc.new_stream(buffer, table.schema) as writer:
+            writer.write_table(table, max_chunksize=_ARROW_BATCH_SIZE)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
 
+def _regexp(pattern: str | None, value: Any) -> bool | None:
+    """SQL ``value REGEXP pattern`` using Python's re module; NULL in, NULL out"""
+    if pattern is None or value is None:
+        return None
+    return _compile_regexp(pattern).search(str(value)) is not None
 
-def get_sqlite_connection(db_path: str) -> sqlite3.Connection:
-    """Get cached SQLite connection"""
-    if db_path not in _connection_cache:
+
+@functools.lru_cache(maxsize=128)
+def _compile_regexp(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _register_functions(conn: sqlite3.Connection) -> None:
+    """
+    Make filtering functions available in SQL so clients filter rows in the query
+    instead of fetching everything and post-processing.
+
+    REGEXP gets a built-in fallback; extensions listed in Config.SQLITE_EXTENSIONS
+    (e.g. sqlean) are loaded afterwards and can replace it with native versions.
+    """
+    conn.create_function("regexp", 2, _regexp, deterministic=True)
+
+    if not Config.SQLITE_EXTENSIONS:
+        return
+    if not hasattr(conn, "enable_load_extension"):
+        logger.warning("This Python build cannot load SQLite extensions; skipping SQLITE_EXTENSIONS")
+        return
+    conn.enable_load_extension(True)
+    try:
+        for extension in Config.SQLITE_EXTENSIONS:
+            conn.load_extension(extension)
+    finally:
+        # Queries must not be able to call load_extension() themselves
+        conn.enable_load_extension(False)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """SQLite connection that remembers the schemas of recently inspected tables"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # table name -> (PRAGMA schema_version it was read at, schema info)
+        self.table_schemas: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
+
+
+class SQLiteConnectionPool:
+    """
+    Bounded, thread-safe pool of SQLite connections, one queue per database file.
+
+    Connections are opened lazily up to ``size`` per database and reused afterwards, so
+    each keeps its warm page cache. When every connection is checked out, up to
+    ``max_overflow`` short-lived extra connections are opened (SQLite connections are
+    cheap to open) and closed after use; beyond that, callers wait for one to be returned
+    instead of sharing a connection across threads.
+    """
+
+    def __init__(self, size: int = 8, timeout: float = 30.0, max_overflow: int = 0) -> None:
+        self.size = size
+        self.timeout = timeout
+        self.max_overflow = max_overflow
+        # Total overflow connections opened, for spotting an undersized pool
+        self.overflows = 0
+        self._pools: dict[str, queue.LifoQueue[sqlite3.Connection]] = {}
+        self._created: dict[str, int] = {}
+        self._overflowing: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        """Open a new connection configured for concurrent, read-heavy use"""
         try:
+            # mode=rw refuses to create the file, so a database deleted while its path is still
+            # cached by _db_exists() fails here instead of silently coming back empty
+            conn = sqlite3.connect(
+                f"{Path(os.path.abspath(db_path)).as_uri()}?mode=rw",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                factory=_PooledConnection,
+            )
             # Enable row factory for dict-like results
-            conn = sqlite3.connect(db_path)
             conn.row_factory = sqlite3.Row
-            _connection_cache[db_path] = conn
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            _register_functions(conn)
             logger.info(f"Created new SQLite connection to {db_path}")
+            return conn
         except Exception as e:
+            _forget_db_path(db_path)
             logger.error(f"Failed to connect to SQLite database {db_path}: {str(e)}")
             raise
 
-    return _connection_cache[db_path]
+    @contextmanager
+    def acquire(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        Check out a connection for ``db_path`` and return it to the pool afterwards.
+
+        Args:
+            db_path: Path to the SQLite database file
+
+        Yields:
+            A connection used exclusively by the caller until the block exits
+
+        Raises:
+            sqlite3.OperationalError: If no connection frees up within the pool timeout
+        """
+        overflow = False
+        with self._lock:
+            pool = self._pools.setdefault(db_path, queue.LifoQueue())
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                conn = None
+                if self._created.get(db_path, 0) < self.size:
+                    self._created[db_path] = self._created.get(db_path, 0) + 1
+                    create = True
+                elif self._overflowing.get(db_path, 0) < self.max_overflow:
+                    self._overflowing[db_path] = self._overflowing.get(db_path, 0) + 1
+                    self.overflows += 1
+                    create = overflow = True
+                else:
+                    create = False
+
+        if conn is None:
+            if create:
+                try:
+                    conn = self._connect(db_path)
+                except Exception:
+                    with self._lock:
+                        counts = self._overflowing if overflow else self._created
+                        counts[db_path] = counts.get(db_path, 1) - 1
+                    raise
+            else:
+                try:
+                    conn = pool.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise sqlite3.OperationalError(f"Timed out waiting for a connection to {db_path}") from None
+
+        try:
+            yield conn
+        finally:
+            # Never hand the next caller a connection with a half-finished transaction
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                current = self._pools.get(db_path)
+                if overflow:
+                    self._overflowing[db_path] -= 1
+            if current is pool and not overflow:
+                pool.put(conn)
+            else:
+                conn.close()
+
+    def discard(self, db_path: str) -> None:
+        """Close idle connections to ``db_path``; connections still in use close on return"""
+        with self._lock:
+            pool = self._pools.pop(db_path, None)
+            self._created.pop(db_path, None)
+        while pool is not None:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def close_all(self) -> None:
+        """Close idle connections to every database, e.g. at interpreter shutdown"""
+        with self._lock:
+            paths = list(self._pools)
+        for db_path in paths:
+            self.discard(db_path)
+
+
+_pool = SQLiteConnectionPool(size=Config.SQLITE_POOL_SIZE, max_overflow=Config.SQLITE_POOL_MAX_OVERFLOW)
+atexit.register(_pool.close_all)
+
+# Connection checked out by the current request (thread or asyncio task), so nested
+# helpers working on the same database share it instead of taking a second one
+_current_connection: ContextVar[tuple[str, sqlite3.Connection] | None] = ContextVar("sqlite_connection", default=None)
+
+
+@contextmanager
+def _connection_scope(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Reuse the request's connection to ``db_path`` if it has one, else check one out of the pool"""
+    current = _current_connection.get()
+    if current is not None and current[0] == db_path:
+        yield current[1]
+        return
+
+    with _pool.acquire(db_path) as conn:
+        token = _current_connection.set((db_path, conn))
+        try:
+            yield conn
+        finally:
+            _current_connection.reset(token)
+
+
+def get_sqlite_connection(db_path: str) -> AbstractContextManager[sqlite3.Connection]:
+    """
+    Check out a pooled SQLite connection; use as ``with get_sqlite_connection(path) as conn:``
+
+    Nested calls for the same database within one request reuse the outer connection,
+    which is returned to the pool when the outermost block exits.
+    """
+    return _connection_scope(db_path)
 
 
 @mcp.tool(description="Execute SQL query against SQLite database")
-def sqlite_execute_query(query: str, database_path: str | None = None) -> dict[str, Any]:
+def sqlite_execute_query(
+    query: str,
+    database_path: str | None = None,
+    parameters: list[Any] | dict[str, Any] | None = None,
+    max_rows: int | None = None,
+    format: Literal["columns", "records", "arrow", "parquet"] = "columns",
+) -> dict[str, Any]:
     """
     Execute a SQL query against a SQLite database.
 
     Args:
-        query: SQL query to execute
+        query: SQL query to execute, using ? or :name placeholders for values
         database_path: Path to SQLite database file (optional, uses default if not provided)
+        parameters: Values bound to the query placeholders (list for ?, dict for :name)
+        max_rows: Maximum rows to return (defaults to MAX_RESULTS_PER_QUERY); extra rows are
+            not fetched and the result is marked as truncated
+        format: "columns" returns column names once plus ``rows`` as lists of values;
+            "records" returns ``results`` as one dict per row; "arrow" (IPC stream) and
+            "parquet" return the rows base64-encoded in ``data_b64`` (requires pyarrow)
 
     Returns:
         Dictionary containing query results and metadata
     """
+    # Check for pyarrow before running anything: a write with RETURNING would otherwise
+    # be committed and then reported as an error
+    if format in ("arrow", "parquet") and importlib.util.find_spec("pyarrow") is None:
+        return {
+            "error": f"The {format} format requires pyarrow",
+            "suggestion": "Install the 'arrow' extra: pip install 'mcp-service-template[arrow]'",
+            "query": query,
+        }
+
     try:
         # Use default database path if not provided
         db_path = database_path or getattr(Config, "DEFAULT_SQLITE_DB", "./data/sample.db")
 
         # Validate database exists
-        if not os.path.exists(db_path):
+        if not _db_exists(db_path):
             return {
                 "error": f"Database file not found: {db_path}",
                 "suggestion": "Create a sample database or provide a valid database_path",
             }
 
-        conn = get_sqlite_connection(db_path)
-        cursor = conn.cursor()
+        # Close the cursor on every exit so an unfinished statement never stays active
+        # on a connection that goes back to the pool
+        with get_sqlite_connection(db_path) as conn, closing(conn.cursor()) as cursor:
+            # Bind values instead of interpolating them: no injection, and an unchanged
+            # query text hits the connection's prepared statement cache
+            cursor.execute(query, parameters or ())
+
+            # Statements that produce rows (SELECT, WITH, PRAGMA, ... RETURNING) have a
+            # description; asking the cursor avoids scanning or case-folding the query text
+            if cursor.description is not None:
+                # Query returns results; fetch in pages so a huge SELECT stops at the cap
+                # instead of materializing every row first
+                limit = max_rows if max_rows is not None else Config.MAX_RESULTS_PER_QUERY
+                columns = [desc[0] for desc in cursor.description]
+                # Rows share one schema, so by default send column names once and plain value lists
+                to_row = dict if format == "records" else list
+                rows: list[Any] = []
+                truncated = False
+                while len(rows) < limit:
+                    batch = cursor.fetchmany(min(_FETCH_BATCH_SIZE, limit - len(rows)))
+                    if not batch:
+                        break
+                    rows.extend(map(to_row, batch))
+                else:
+                    truncated = cursor.fetchone() is not None
+
+                # INSERT/UPDATE/DELETE ... RETURNING opened a transaction that must be kept.
+                # SQLite won't commit while a capped fetch leaves the statement mid-step, and
+                # it applies every change on the first step, so close the cursor first
+                if conn.in_transaction:
+                    cursor.close()
+                    conn.commit()
+
+                result: dict[str, Any] = {
+                    "status": "success",
+                    "query": query,
+                    "database": db_path,
+                    "row_count": len(rows),
+                    "truncated": truncated,
+                    "columns": columns,
+                }
+                if format in ("arrow", "parquet"):
+                    result["format"] = format
+                    result["data_b64"] = _encode_columnar(columns, rows, format)
+                else:
+                    result["results" if format == "records" else "rows"] = rows
+                return result
+            else:
+                # Query modifies data
+                conn.commit()
+                return {
+                    "status": "success",
+                    "query": query,
+                    "database": db_path,
+                    "rows_affected": cursor.rowcount,
+                    "message": "Query executed successfully",
+                }
+
+    except sqlite3.Error as e:
+        logger.error(f"SQLite query error: {str(e)}")
+        return {
+            "error": f"SQLite error: {str(e)}",
+            "query": query,
+            "database": db_path if "db_path" in locals() else "unknown",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error executing SQLite query: {str(e)}")
+        return {"error": f"Unexpected error: {str(e)}", "query": query}
+
+
+@mcp.tool(description="Execute one SQL statement for many parameter rows in a single transaction")
+def sqlite_execute_many(
+    query: str,
+    param_rows: list[list[Any]] | list[dict[str, Any]],
+    database_path: str | None = None,
+) -> dict[str, Any]:
+    """
+    Execute a write statement once per parameter row, committing them all together.
 
-        # Execute query
-        cursor.execute(query)
+    Prefer this over calling sqlite_execute_query in a loop for bulk inserts/updates:
+    the statement is prepared once and the whole batch commits (or rolls back) as one
+    transaction.
+
+    Args:
+        query: SQL statement with ? or :name placeholders
+        param_rows: One list (for ?) or dict (for :name) of values per execution
+        database_path: Path to SQLite database file (optional, uses default if not provided)
 
-        # Handle different query types
-        if query.strip().upper().startswith(("SELECT", "WITH", "EXPLAIN")):
-            # Query returns results
-            rows = cursor.fetchall()
-            results = [dict(row) for row in rows]
+    Returns:
+        Dictionary containing the number of rows affected and metadata
+    """
+    try:
+        db_path = database_path or getattr(Config, "DEFAULT_SQLITE_DB", "./data/sample.db")
 
+        if not _db_exists(db_path):
             return {
-                "status": "success",
-                "query": query,
-                "database": db_path,
-                "results": results,
-                "row_count": len(results),
-                "columns": [desc[0] for desc in cursor.description] if cursor.description else [],
+                "error": f"Database file not found: {db_path}",
+                "suggestion": "Create a sample database or provide a valid database_path",
             }
-        else:
-            # Query modifies data
-            conn.commit()
+
+        if len(param_rows) > _MAX_BATCH_ROWS:
+            return {"error": f"Too many parameter rows: {len(param_rows)} (maximum {_MAX_BATCH_ROWS})"}
+
+        with get_sqlite_connection(db_path) as conn:
+            # The connection context manager commits on success and rolls back on error
+            with conn:
+                cursor = conn.executemany(query, param_rows)
+
             return {
                 "status": "success",
                 "query": query,
                 "database": db_path,
                 "rows_affected": cursor.rowcount,
-                "message": "Query executed successfully",
+                "batch_size": len(param_rows),
+                "message": "Batch executed successfully",
             }
 
     except sqlite3.Error as e:
-        logger.error(f"SQLite query error: {str(e)}")
+        logger.error(f"SQLite batch error: {str(e)}")
         return {
             "error": f"SQLite error: {str(e)}",
             "query": query,
             "database": db_path if "db_path" in locals() else "unknown",
         }
     except Exception as e:
-        logger.error(f"Unexpected error executing SQLite query: {str(e)}")
+        logger.error(f"Unexpected error executing SQLite batch: {str(e)}")
         return {"error": f"Unexpected error: {str(e)}", "query": query}
 
 
@@ -124,38 +621,57 @@ def sqlite_get_table_schema(table_name: str, database_path: str | None = None) -
     try:
         db_path = database_path or getattr(Config, "DEFAULT_SQLITE_DB", "./data/sample.db")
 
-        if not os.path.exists(db_path):
+        if not _db_exists(db_path):
             return {"error": f"Database file not found: {db_path}"}
 
-        conn = get_sqlite_connection(db_path)
-        cursor = conn.cursor()
+        with get_sqlite_connection(db_path) as conn:
+            # schema_version is bumped by every schema change from any connection, so a cached
+            # answer read at the current version is still accurate
+            schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+            cache = getattr(conn, "table_schemas", None)
+            cached = cache.get(table_name) if cache is not None else None
+            if cached is not None and cached[0] == schema_version:
+                cache.move_to_end(table_name)
+                logger.info(f"Retrieved schema for table {table_name}")
+                # Hand out a copy so a caller editing its result can't change later answers
+                return copy.deepcopy(cached[1])
+
+            cursor = conn.cursor()
+
+            # The pragma_* table-valued functions accept a bound table name, unlike the
+            # PRAGMA statement form, so the SQL text stays constant and is prepared once
+            columns = _fetch_columnar(
+                cursor, 'SELECT name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)', (table_name,)
+            )
 
-        # Get table info
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        columns = cursor.fetchall()
+            if not columns["name"]:
+                return {"error": f"Table '{table_name}' not found"}
 
-        if not columns:
-            return {"error": f"Table '{table_name}' not found"}
+            # Get foreign keys
+            foreign_keys = _fetch_columnar(
+                cursor, 'SELECT "from", "table", "to" FROM pragma_foreign_key_list(?)', (table_name,)
+            )
 
-        # Get foreign keys
-        cursor.execute(f"PRAGMA foreign_key_list({table_name})")
-        foreign_keys = cursor.fetchall()
+            # Get indexes
+            indexes = _fetch_columnar(cursor, 'SELECT name, "unique", origin FROM pragma_index_list(?)', (table_name,))
 
-        # Get indexes
-        cursor.execute(f"PRAGMA index_list({table_name})")
-        indexes = cursor.fetchall()
+            schema_info = {
+                "table_name": table_name,
+                "database": db_path,
+                "columns": columns,
+                "foreign_keys": foreign_keys,
+                "indexes": indexes,
+                "column_count": len(columns["name"]),
+            }
 
-        schema_info = {
-            "table_name": table_name,
-            "database": db_path,
-            "columns": [dict(col) for col in columns],
-            "foreign_keys": [dict(fk) for fk in foreign_keys],
-            "indexes": [dict(idx) for idx in indexes],
-            "column_count": len(columns),
-        }
+            if cache is not None:
+                cache[table_name] = (schema_version, copy.deepcopy(schema_info))
+                cache.move_to_end(table_name)
+                if len(cache) > _STATEMENT_CACHE_SIZE:
+                    cache.popitem(last=False)
 
-        logger.info(f"Retrieved schema for table {table_name}")
-        return schema_info
+            logger.info(f"Retrieved schema for table {table_name}")
+            return schema_info
 
     except sqlite3.Error as e:
         logger.error(f"SQLite schema error: {str(e)}")
@@ -176,36 +692,38 @@ def sqlite_list_tables(database_path: str | None = None) -> dict[str, Any]:
     try:
         db_path = database_path or getattr(Config, "DEFAULT_SQLITE_DB", "./data/sample.db")
 
-        if not os.path.exists(db_path):
+        if not _db_exists(db_path):
             return {"error": f"Database file not found: {db_path}"}
 
-        conn = get_sqlite_connection(db_path)
-        cursor = conn.cursor()
-
-        # Get all tables
-        cursor.execute("""
-            SELECT name, type, sql
-            FROM sqlite_master
-            WHERE type IN ('table', 'view')
-            ORDER BY name
-        """)
-
-        tables = cursor.fetchall()
-        table_list = []
-
-        for table in tables:
-            # Get row count for each table
-            if table["type"] == "table":
-                cursor.execute(f"SELECT COUNT(*) as count FROM {table['name']}")
-                row_count = cursor.fetchone()["count"]
-            else:
-                row_count = None
-
-            table_list.append(
-                {"name": table["name"], "type": table["type"], "row_count": row_count, "sql": table["sql"]}
-            )
-
-        return {"database": db_path, "tables": table_list, "table_count": len(table_list)}
+        with get_sqlite_connection(db_path) as conn:
+            cursor = conn.cursor()
+
+            # Read the table list and the counts from one snapshot
+            conn.execute("BEGIN")
+            try:
+                # Get all tables
+                cursor.execute("""
+                    SELECT name, type, sql
+                    FROM sqlite_master
+                    WHERE type IN ('table', 'view')
+                    ORDER BY name
+                """)
+                tables = cursor.fetchall()
+                row_counts = _count_rows(cursor, [t["name"] for t in tables if t["type"] == "table"])
+            finally:
+                conn.commit()
+
+            table_list = [
+                {
+                    "name": table["name"],
+                    "type": table["type"],
+                    "row_count": row_counts.get(table["name"]),
+                    "sql": table["sql"],
+                }
+                for table in tables
+            ]
+
+            return {"database": db_path, "tables": table_list, "table_count": len(table_list)}
 
     except sqlite3.Error as e:
         logger.error(f"SQLite list tables error: {str(e)}")
@@ -228,15 +746,24 @@ def sqlite_sample_table_data(table_name: str, limit: int = 10, database_path: st
     try:
         db_path = database_path or getattr(Config, "DEFAULT_SQLITE_DB", "./data/sample.db")
 
-        if not os.path.exists(db_path):
+        if not _db_exists(db_path):
             return {"error": f"Database file not found: {db_path}"}
 
         # Validate limit
         if limit < 1 or limit > 1000:
             return {"error": "Limit must be between 1 and 1000"}
 
-        query = f"SELECT * FROM {table_name} LIMIT {limit}"
-        result = sqlite_execute_query(query, db_path)
+        # Identifiers can't be bound as parameters, so only accept names that actually exist
+        with get_sqlite_connection(db_path) as conn:
+            known = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (table_name,)
+            ).fetchone()
+            if not known:
+                return {"error": f"Table '{table_name}' not found"}
+
+            # Runs on the connection checked out above
+            query = f"SELECT * FROM {_quote_ident(table_name)} LIMIT ?"
+            result = sqlite_execute_query(query, db_path, [limit])
 
         if "error" in result:
             return result
@@ -244,7 +771,7 @@ def sqlite_sample_table_data(table_name: str, limit: int = 10, database_path: st
         # Add sampling metadata
         result["sampling_info"] = {
             "table_name": table_name,
-            "sample_size": len(result.get("results", [])),
+            "sample_size": result["row_count"],
             "limit_requested": limit,
         }
 
@@ -272,97 +799,29 @@ def sqlite_create_sample_database(database_path: str | None = None) -> dict[str,
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-        # Create connection
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create sample tables
-        cursor.executescript("""
-            -- Customers table
-            CREATE TABLE IF NOT EXISTS customers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                city TEXT,
-                signup_date DATE,
-                is_active BOOLEAN DEFAULT 1
-            );
-
-            -- Products table
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                category TEXT,
-                price DECIMAL(10,2),
-                stock_quantity INTEGER DEFAULT 0
-            );
-
-            -- Orders table
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_id INTEGER,
-                order_date DATE,
-                total_amount DECIMAL(10,2),
-                status TEXT DEFAULT 'pending',
-                FOREIGN KEY (customer_id) REFERENCES customers (id)
-            );
-
-            -- Order items table
-            CREATE TABLE IF NOT EXISTS order_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id INTEGER,
-                product_id INTEGER,
-                quantity INTEGER,
-                unit_price DECIMAL(10,2),
-                FOREIGN KEY (order_id) REFERENCES orders (id),
-                FOREIGN KEY (product_id) REFERENCES products (id)
-            );
-        """)
-
-        # Insert sample data
-        cursor.executescript("""
-            -- Sample customers
-            INSERT OR REPLACE INTO customers (name, email, city, signup_date) VALUES
-            ('Alice Johnson', 'alice@example.com', 'New York', '2024-01-15'),
-            ('Bob Smith', 'bob@example.com', 'Los Angeles', '2024-02-20'),
-            ('Carol Davis', 'carol@example.com', 'Chicago', '2024-03-10'),
-            ('David Wilson', 'david@example.com', 'Houston', '2024-04-05'),
-            ('Eva Brown', 'eva@example.com', 'Phoenix', '2024-05-12');
-
-            -- Sample products
-            INSERT OR REPLACE INTO products (name, category, price, stock_quantity) VALUES
-            ('Laptop Pro', 'Electronics', 1299.99, 50),
-            ('Wireless Mouse', 'Electronics', 29.99, 200),
-            ('Office Chair', 'Furniture', 249.99, 30),
-            ('Coffee Mug', 'Kitchen', 12.99, 100),
-            ('Notebook Set', 'Office', 15.99, 150);
-
-            -- Sample orders
-            INSERT OR REPLACE INTO orders (customer_id, order_date, total_amount, status) VALUES
-            (1, '2024-06-01', 1329.98, 'completed'),
-            (2, '2024-06-05', 29.99, 'completed'),
-            (3, '2024-06-10', 262.98, 'shipped'),
-            (4, '2024-06-15', 28.98, 'pending'),
-            (1, '2024-06-20', 15.99, 'completed');
-
-            -- Sample order items
-            INSERT OR REPLACE INTO order_items (order_id, product_id, quantity, unit_price) VALUES
-            (1, 1, 1, 1299.99),
-            (1, 2, 1, 29.99),
-            (2, 2, 1, 29.99),
-            (3, 3, 1, 249.99),
-            (3, 5, 1, 12.99),
-            (4, 4, 2, 12.99),
-            (4, 5, 1, 15.99),
-            (5, 5, 1, 15.99);
-        """)
-
-        conn.commit()
-        conn.close()
+        # Create connection. isolation_level=None hands transaction control to us so the
+        # whole build runs in one explicit transaction instead of autocommitting per statement.
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            for pragma in _BULK_LOAD_PRAGMAS:
+                conn.execute(pragma)
+
+            conn.execute("BEGIN")
+            # executescript() would COMMIT implicitly, so run statements one by one
+            for statement in _SAMPLE_SCHEMA:
+                conn.execute(statement)
+            for insert, rows in _SAMPLE_DATA:
+                conn.executemany(insert, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
 
-        # Update cache if this is the default database
-        if db_path in _connection_cache:
-            del _connection_cache[db_path]
+        # Drop pooled connections opened against the previous file contents
+        _pool.discard(db_path)
 
         return {
             "status": "success",
@@ -12,21 +12,38 @@ after the setup process. It can be used by:
 Usage:
     python3 test_uv_compatibility.py
 
-The script will create a temporary copy of the template, run the setup process,
-and validate that uv can successfully install dependencies and run commands.
+The script runs the setup process into a temporary directory and validates that
+uv can successfully install dependencies and run commands in the generated project.
 """
 
-import shutil
+import contextlib
+import io
+import os
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
+import setup_template
+
+# Answers fed to setup_template.main(); target_directory is filled in per run
+SETUP_VALUES = {
+    "service_name": "test_service",
+    "Service Name": "Test Service",
+    "Service Description": "Test service for validation",
+    "Domain": "Test Domain",
+    "domain": "test domain",
+}
+
+# Persistent uv cache so repeated runs reuse downloaded wheels instead of fetching them again
+UV_CACHE_DIR = Path(tempfile.gettempdir()) / "mcp-template-uv-cache"
+
 
 def run_command(cmd, cwd=None):
-    """Run a command and return success status"""
+    """Run a command (argv list, no shell) and return success status"""
+    env = {**os.environ, "UV_CACHE_DIR": os.environ.get("UV_CACHE_DIR", str(UV_CACHE_DIR))}
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, env=env)
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
@@ -38,32 +55,25 @@ def test_uv_after_setup():
 
     # Create a temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        template_copy = temp_path / "test_template"
-
-        # Copy template to temp directory
-        current_dir = Path(__file__).parent
-        shutil.copytree(current_dir, template_copy, ignore=shutil.ignore_patterns(".git", "__pycache__", "*.pyc"))
+        project_dir = Path(temp_dir) / "test_service"
 
-        print(f"📁 Created test copy in: {template_copy}")
-
-        # Run setup script with test values
+        # Run setup in-process with test values. Setup only reads the template and writes
+        # a fresh copy to the target directory, so the template itself needs no copy.
         print("🔧 Running setup script...")
 
-        # Create input for setup script
-        setup_input = "test_service\nTest Service\nTest service for validation\nTest Domain\n\n\n"
-
-        success, stdout, stderr = run_command(f"echo '{setup_input}' | python3 setup_template.py", cwd=template_copy)
-
-        if not success:
-            print(f"❌ Setup script failed: {stderr}")
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                setup_template.main({**SETUP_VALUES, "target_directory": str(project_dir)})
+        except (Exception, SystemExit) as e:
+            print(f"❌ Setup script failed: {e!r}\n{output.getvalue()}")
             return False
 
-        print("✅ Setup script completed")
+        print(f"✅ Setup script completed: {project_dir}")
 
         # Check if uv can now parse the project
         print("📦 Testing uv sync...")
-        success, stdout, stderr = run_command("uv sync --all-extras", cwd=template_copy)
+        success, stdout, stderr = run_command(["uv", "sync", "--all-extras"], cwd=project_dir)
 
         if success:
             print("✅ uv sync successful")
@@ -71,7 +81,7 @@ def test_uv_after_setup():
             # Test running a simple command
             print("🧪 Testing uv run...")
             success, stdout, stderr = run_command(
-                "uv run python3 -c 'import test_service_mcp; print(\"Import successful\")'", cwd=template_copy
+                ["uv", "run", "python3", "-c", "import test_service_mcp; print('Import successful')"], cwd=project_dir
             )
 
             if success:
@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Repository root, resolved once per test session (and once per xdist worker)."""
+    return Path(__file__).resolve().parent.parent
@@ -0,0 +1,51 @@
+"""Shared fixtures for the analytics domain tests."""
+
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mock_analysis_payload():
+    """Mock analysis data, generated once per session; tests must not mutate it."""
+    from service_name_mcp.analytics_domain.analytics_tools import _generate_mock_analysis_data
+
+    return _generate_mock_analysis_data()
+
+
+@pytest.fixture(scope="session")
+def default_contribution_result():
+    """contribution_analysis() result for the default date ranges, computed once per session."""
+    from service_name_mcp.analytics_domain.analytics_tools import contribution_analysis
+
+    return contribution_analysis(
+        current_start_date="2024-01-01",
+        current_end_date="2024-01-31",
+        comparison_start_date="2023-01-01",
+        comparison_end_date="2023-01-31",
+    )
+
+
+@pytest.fixture(scope="session")
+def analytics_domain_dir(project_root):
+    """Source directory of the analytics domain."""
+    return project_root / "src" / "service_name_mcp" / "analytics_domain"
+
+
+@pytest.fixture(scope="session")
+def analytics_dir_listing(analytics_domain_dir):
+    """Names of the entries in the analytics domain directory, listed once per session."""
+    return {path.name for path in analytics_domain_dir.iterdir()}
+
+
+@pytest.fixture(scope="session")
+def sample_raw_contributors():
+    """Raw contributor data for formatting tests, frozen so a mutating test fails loudly."""
+    return MappingProxyType(
+        {
+            "contributors": (
+                MappingProxyType({"dim": "Country", "value": "US", "impact": 15.5}),
+                MappingProxyType({"dim": "PaymentMethod", "value": "CreditCard", "impact": -8.2}),
+            )
+        }
+    )
@@ -0,0 +1,14 @@
+"""Shared fixtures for the file processing domain tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_files_dir(tmp_path_factory):
+    """Directory populated by create_sample_files() once per session; tests must not modify it."""
+    from service_name_mcp.file_processing_domain.file_processing_tools import create_sample_files
+
+    directory = tmp_path_factory.mktemp("samples")
+    result = create_sample_files(output_directory=str(directory))
+    assert result.get("status") == "success", result
+    return directory
@@ -75,13 +75,38 @@ def test_main_server_function():
 
         # Test that main function can be called
         try:
-            main()
+            with patch("service_name_mcp.server.sys.setswitchinterval") as mock_switch:
+                main()
             mock_run.assert_called_once_with(transport="stdio")
+            mock_switch.assert_called_once_with(0.001)
         except SystemExit:
             # Expected when running in test environment
             pass
 
 
+def test_domain_modules_registered_lazily():
+    """Test that domain modules are imported once, on the first registry request."""
+    import asyncio
+
+    from mcp import types
+
+    from service_name_mcp import server
+    from service_name_mcp.mcp_instance import mcp
+
+    handler = mcp._mcp_server.request_handlers[types.ListToolsRequest]
+    request = types.ListToolsRequest(method="tools/list")
+
+    with (
+        patch.object(server, "DOMAIN_MODULES", ("rest_api_domain.rest_api_tools",)),
+        patch.object(server, "_domains_registered", False),
+        patch("service_name_mcp.server.importlib.import_module") as mock_import,
+    ):
+        asyncio.run(handler(request))
+        asyncio.run(handler(request))
+
+        mock_import.assert_called_once_with(".rest_api_domain.rest_api_tools", "service_name_mcp")
+
+
 # TODO: Add more comprehensive tests
 # - Test tool registration
 # - Test prompt loading
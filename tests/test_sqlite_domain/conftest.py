@@ -0,0 +1,14 @@
+"""Shared fixtures for the SQLite domain tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_db_template(tmp_path_factory):
+    """Demo database built by sqlite_create_sample_database() once per session; copy it, don't modify it."""
+    from service_name_mcp.sqlite_domain.sqlite_tools import sqlite_create_sample_database
+
+    db_path = tmp_path_factory.mktemp("sqlite_template") / "template.db"
+    result = sqlite_create_sample_database(str(db_path))
+    assert result.get("status") == "success", result
+    return db_path
@@ -4,104 +4,103 @@ Test suite for SQLite Domain
 This module contains unit tests for SQLite database integration tools.
 """
 
+import base64
+import io
 import os
+import shutil
 import sqlite3
-import tempfile
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
+sqlite_tools = pytest.importorskip("service_name_mcp.sqlite_domain.sqlite_tools")
+
 # Note: These tests use the template placeholders and will work after setup_template.py is run
 
 
-class TestSQLiteTools:
-    """Test SQLite domain functionality."""
-
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary SQLite database for testing."""
-        # Create a temporary file
-        db_fd, db_path = tempfile.mkstemp(suffix=".db")
-        os.close(db_fd)
-
-        # Initialize with test data
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create test tables
-        cursor.execute("""
-            CREATE TABLE users (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE orders (
-                id INTEGER PRIMARY KEY,
-                user_id INTEGER,
-                product TEXT,
-                amount DECIMAL(10,2),
-                order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        """)
-
-        # Insert test data
-        cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("John Doe", "john@example.com"))
-        cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("Jane Smith", "jane@example.com"))
-        cursor.execute("INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)", (1, "Widget", 29.99))
-        cursor.execute("INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)", (2, "Gadget", 49.99))
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """Swap the sqlite_tools logger for a Mock in every test; request it by name to assert on calls."""
+    fake = Mock()
+    monkeypatch.setattr(sqlite_tools, "logger", fake)
+    return fake
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Create a temporary SQLite database once per module; the tests using it only read from it."""
+    db_path = str(tmp_path_factory.mktemp("sqlite") / "test.db")
+
+    # Initialize with test data
+    conn = sqlite3.connect(db_path)
+    # Throwaway database: skip fsyncs and keep the rollback journal in memory
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    cursor = conn.cursor()
+
+    # Create test tables
+    cursor.execute("""
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER,
+            product TEXT,
+            amount DECIMAL(10,2),
+            order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    """)
 
-        conn.commit()
-        conn.close()
+    # Insert test data
+    cursor.executemany(
+        "INSERT INTO users (name, email) VALUES (?, ?)",
+        [("John Doe", "john@example.com"), ("Jane Smith", "jane@example.com")],
+    )
+    cursor.executemany(
+        "INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)",
+        [(1, "Widget", 29.99), (2, "Gadget", 49.99)],
+    )
 
-        yield db_path
+    conn.commit()
+    conn.close()
 
-        # Cleanup
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+    return db_path
 
-    def test_sqlite_tools_import(self):
-        """Test that SQLite tools can be imported."""
-        try:
-            from service_name_mcp.sqlite_domain import sqlite_tools
 
-            assert sqlite_tools is not None
-        except ImportError as e:
-            pytest.fail(f"Failed to import SQLite tools: {e}")
+class TestSQLiteTools:
+    """Test SQLite domain functionality."""
 
-    @patch("service_name_mcp.sqlite_domain.sqlite_tools.logger")
     def test_execute_query_success(self, mock_logger, temp_db):
         """Test successful query execution."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query
-
         # Test simple SELECT query
-        result = execute_sql_query(
+        result = sqlite_tools.execute_sql_query(
             query="SELECT name, email FROM users WHERE id = ?", database_path=temp_db, parameters=(1,)
         )
 
         assert isinstance(result, list)
         assert len(result) > 0
-        assert "John Doe" in str(result)
+        assert result[0][0] == "John Doe"
         mock_logger.info.assert_called()
 
-    @patch("service_name_mcp.sqlite_domain.sqlite_tools.logger")
-    def test_execute_query_with_limit(self, mock_logger, temp_db):
+    def test_execute_query_with_limit(self, temp_db):
         """Test query execution with result limit."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query
-
-        result = execute_sql_query(query="SELECT * FROM users", database_path=temp_db, limit=1)
+        result = sqlite_tools.execute_sql_query(query="SELECT * FROM users", database_path=temp_db, limit=1)
 
         assert isinstance(result, list)
         assert len(result) <= 1
 
-    @patch("service_name_mcp.sqlite_domain.sqlite_tools.logger")
     def test_execute_query_error_handling(self, mock_logger, temp_db):
         """Test query execution error handling."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query
+        # Look the tool up first so a missing attribute isn't mistaken for the expected error
+        execute_sql_query = sqlite_tools.execute_sql_query
 
         # Test invalid SQL
         with pytest.raises(Exception):  # noqa: B017
@@ -109,12 +108,9 @@ class TestSQLiteTools:
 
         mock_logger.error.assert_called()
 
-    @patch("service_name_mcp.sqlite_domain.sqlite_tools.logger")
-    def test_get_schema_info(self, mock_logger, temp_db):
+    def test_get_schema_info(self, temp_db):
         """Test schema information retrieval."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import get_schema_info
-
-        result = get_schema_info(database_path=temp_db)
+        result = sqlite_tools.get_schema_info(database_path=temp_db)
 
         assert isinstance(result, dict)
         assert "tables" in result
@@ -125,12 +121,9 @@ class TestSQLiteTools:
         assert "users" in table_names
         assert "orders" in table_names
 
-    @patch("service_name_mcp.sqlite_domain.sqlite_tools.logger")
-    def test_get_table_sample(self, mock_logger, temp_db):
+    def test_get_table_sample(self, temp_db):
         """Test table data sampling."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import get_table_sample
-
-        result = get_table_sample(table_name="users", database_path=temp_db, sample_size=5)
+        result = sqlite_tools.get_table_sample(table_name="users", database_path=temp_db, sample_size=5)
 
         assert isinstance(result, list)
         assert len(result) <= 5
@@ -139,7 +132,8 @@ class TestSQLiteTools:
 
     def test_database_path_validation(self, temp_db):
         """Test database path validation."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query
+        # Look the tool up first so a missing attribute isn't mistaken for the expected error
+        execute_sql_query = sqlite_tools.execute_sql_query
 
         # Test with non-existent database
         with pytest.raises(Exception):  # noqa: B017
@@ -147,11 +141,9 @@ class TestSQLiteTools:
 
     def test_sql_injection_protection(self, temp_db):
         """Test SQL injection protection through parameterized queries."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query
-
         # This should work safely with parameters
         malicious_input = "'; DROP TABLE users; --"
-        result = execute_sql_query(
+        result = sqlite_tools.execute_sql_query(
             query="SELECT * FROM users WHERE name = ?", database_path=temp_db, parameters=(malicious_input,)
         )
 
@@ -160,22 +152,393 @@ class TestSQLiteTools:
         assert len(result) == 0
 
         # Verify table still exists
-        schema = execute_sql_query(
+        schema = sqlite_tools.execute_sql_query(
             query="SELECT name FROM sqlite_master WHERE type='table' AND name='users'", database_path=temp_db
         )
         assert len(schema) == 1
 
 
+class TestSQLiteWorkingTools:
+    """Test the SQLite tools against the demo database they create."""
+
+    @pytest.fixture
+    def sample_db(self, tmp_path, sample_db_template):
+        """Copy the session's demo e-commerce database to a temporary file this test may modify."""
+        db_path = str(tmp_path / "sample.db")
+        shutil.copyfile(sample_db_template, db_path)
+        yield db_path
+
+        # Close the pooled connections opened against this copy so they don't pile up across tests
+        sqlite_tools._pool.discard(db_path)
+
+    def test_sqlite_create_sample_database(self, sample_db):
+        """Test that the sample database is created with all demo tables and rows."""
+        conn = sqlite3.connect(sample_db)
+        try:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("customers", "products", "orders", "order_items")
+            }
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert counts == {"customers": 5, "products": 5, "orders": 5, "order_items": 8}
+        assert journal_mode == "wal"
+
+    def test_sqlite_create_sample_database_rolls_back_on_error(self, tmp_path):
+        """Test that a failure part-way through leaves no partial data behind."""
+        db_path = str(tmp_path / "broken.db")
+        broken_data = sqlite_tools._SAMPLE_DATA[:1] + (("INSERT INTO missing_table VALUES (?)", ((1,),)),)
+        with patch.object(sqlite_tools, "_SAMPLE_DATA", broken_data):
+            result = sqlite_tools.sqlite_create_sample_database(db_path)
+
+        assert "no such table: missing_table" in result["error"]
+        conn = sqlite3.connect(db_path)
+        try:
+            tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        finally:
+            conn.close()
+        assert tables == []
+
+    def test_sqlite_execute_query_with_parameters(self, sample_db):
+        """Test that values are bound as parameters rather than interpolated."""
+        result = sqlite_tools.sqlite_execute_query(
+            "SELECT name FROM customers WHERE city = ?", database_path=sample_db, parameters=["Chicago"]
+        )
+        assert result["columns"] == ["name"]
+        assert result["rows"] == [["Carol Davis"]]
+
+        result = sqlite_tools.sqlite_execute_query(
+            "SELECT name FROM customers WHERE name = :name",
+            database_path=sample_db,
+            parameters={"name": "x' OR '1'='1"},
+        )
+        assert result["row_count"] == 0
+
+    def test_sqlite_execute_query_records_format(self, sample_db):
+        """Test the opt-in records layout returns one dict per row."""
+        query = "SELECT id, name FROM products WHERE id <= 2 ORDER BY id"
+
+        columnar = sqlite_tools.sqlite_execute_query(query, database_path=sample_db)
+        assert columnar["columns"] == ["id", "name"]
+        assert columnar["rows"] == [[1, "Laptop Pro"], [2, "Wireless Mouse"]]
+        assert "results" not in columnar
+
+        records = sqlite_tools.sqlite_execute_query(query, database_path=sample_db, format="records")
+        assert records["results"] == [{"id": 1, "name": "Laptop Pro"}, {"id": 2, "name": "Wireless Mouse"}]
+        assert "rows" not in records
+
+    @pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+    def test_sqlite_execute_query_binary_formats(self, fmt, sample_db):
+        """Test Arrow and Parquet results decode back to the selected rows."""
+        pa = pytest.importorskip("pyarrow")
+
+        result = sqlite_tools.sqlite_execute_query(
+            "SELECT id, name, price FROM products ORDER BY id", database_path=sample_db, format=fmt
+        )
+        assert result["format"] == fmt
+        assert result["row_count"] == 5
+        assert "rows" not in result
+
+        data = base64.b64decode(result["data_b64"])
+        if fmt == "arrow":
+            table = pa.ipc.open_stream(data).read_all()
+        else:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(io.BytesIO(data))
+
+        assert table.column_names == ["id", "name", "price"]
+        assert table.column("name").to_pylist()[0] == "Laptop Pro"
+        assert table.column("id").type == pa.int64()
+
+    def test_sqlite_execute_query_binary_format_without_pyarrow(self, sample_db):
+        """Test a missing pyarrow is reported before the query runs, so nothing is written."""
+        with patch.object(sqlite_tools.importlib.util, "find_spec", return_value=None):
+            result = sqlite_tools.sqlite_execute_query(
+                "INSERT INTO products (name) VALUES ('Desk Lamp') RETURNING id",
+                database_path=sample_db,
+                format="parquet",
+            )
+        assert "requires pyarrow" in result["error"]
+
+        check = sqlite_tools.sqlite_execute_query("SELECT COUNT(*) FROM products", database_path=sample_db)
+        assert check["rows"] == [[5]]
+
+    def test_sqlite_execute_query_detects_row_returning_statements(self, sample_db):
+        """Test rows come back for any statement that yields them, and RETURNING writes are committed."""
+        pragma = sqlite_tools.sqlite_execute_query("  pragma journal_mode", database_path=sample_db)
+        assert pragma["rows"] == [["wal"]]
+
+        values = sqlite_tools.sqlite_execute_query("VALUES (1, 'a')", database_path=sample_db)
+        assert values["rows"] == [[1, "a"]]
+
+        inserted = sqlite_tools.sqlite_execute_query(
+            "INSERT INTO products (name) VALUES ('Desk Lamp') RETURNING id", database_path=sample_db
+        )
+        assert inserted["rows"] == [[6]]
+        check = sqlite_tools.sqlite_execute_query("SELECT name FROM products WHERE id = 6", database_path=sample_db)
+        assert check["rows"] == [["Desk Lamp"]]
+
+        updated = sqlite_tools.sqlite_execute_query("UPDATE products SET stock_quantity = 0", database_path=sample_db)
+        assert updated["rows_affected"] == 6
+
+    def test_sqlite_execute_query_truncated_returning_commits(self, sample_db):
+        """Test a RETURNING write cut off by max_rows still commits and leaves the connection usable."""
+        updated = sqlite_tools.sqlite_execute_query(
+            "UPDATE products SET stock_quantity = stock_quantity + 1000 RETURNING stock_quantity",
+            database_path=sample_db,
+            max_rows=2,
+        )
+        assert "error" not in updated
+        assert updated["row_count"] == 2
+        assert updated["truncated"] is True
+
+        check = sqlite_tools.sqlite_execute_query(
+            "SELECT COUNT(*) FROM products WHERE stock_quantity >= 1000", database_path=sample_db
+        )
+        assert check["rows"] == [[5]]
+
+        inserted = sqlite_tools.sqlite_execute_query(
+            "INSERT INTO products (name) VALUES ('Desk Lamp')", database_path=sample_db
+        )
+        assert inserted["rows_affected"] == 1
+
+    def test_sqlite_execute_query_max_rows(self, sample_db):
+        """Test that results stop at max_rows and report truncation."""
+        result = sqlite_tools.sqlite_execute_query("SELECT * FROM order_items", database_path=sample_db, max_rows=3)
+        assert result["row_count"] == 3
+        assert result["truncated"] is True
+
+        result = sqlite_tools.sqlite_execute_query("SELECT * FROM order_items", database_path=sample_db, max_rows=8)
+        assert result["row_count"] == 8
+        assert result["truncated"] is False
+
+    def test_sqlite_execute_many(self, sample_db):
+        """Test batch writes commit together and roll back together."""
+        insert = "INSERT INTO products (name, category, price) VALUES (?, ?, ?)"
+        result = sqlite_tools.sqlite_execute_many(
+            insert, [["Desk Lamp", "Furniture", 39.99], ["Stapler", "Office", 8.49]], database_path=sample_db
+        )
+        assert result["status"] == "success"
+        assert result["rows_affected"] == 2
+
+        # A failing row rolls back the rows before it
+        result = sqlite_tools.sqlite_execute_many(
+            "INSERT INTO customers (name, email) VALUES (?, ?)",
+            [["Frank", "frank@example.com"], ["Alice Again", "alice@example.com"]],
+            database_path=sample_db,
+        )
+        assert "UNIQUE constraint failed" in result["error"]
+
+        counts = sqlite_tools.sqlite_execute_query(
+            "SELECT (SELECT COUNT(*) FROM products), (SELECT COUNT(*) FROM customers)", database_path=sample_db
+        )
+        assert counts["rows"] == [[7, 5]]
+
+    @patch.object(sqlite_tools, "_MAX_BATCH_ROWS", 2)
+    def test_sqlite_execute_many_rejects_oversized_batches(self, sample_db):
+        """Test batches above the row cap are refused before touching the database."""
+        result = sqlite_tools.sqlite_execute_many(
+            "INSERT INTO orders (customer_id) VALUES (?)", [[1], [2], [3]], sample_db
+        )
+        assert result["error"] == "Too many parameter rows: 3 (maximum 2)"
+
+    def test_sqlite_sample_table_data(self, sample_db):
+        """Test sampling rows and rejecting table names that don't exist."""
+        result = sqlite_tools.sqlite_sample_table_data("products", limit=3, database_path=sample_db)
+        assert result["row_count"] == 3
+        assert result["sampling_info"]["sample_size"] == 3
+
+        result = sqlite_tools.sqlite_sample_table_data("products; DROP TABLE customers", database_path=sample_db)
+        assert result["error"] == "Table 'products; DROP TABLE customers' not found"
+
+    def test_sqlite_get_table_schema(self, sample_db):
+        """Test the schema is returned column-wise with only the useful PRAGMA fields."""
+        schema = sqlite_tools.sqlite_get_table_schema("order_items", database_path=sample_db)
+
+        assert schema["column_count"] == 5
+        assert schema["columns"]["name"] == ["id", "order_id", "product_id", "quantity", "unit_price"]
+        assert schema["columns"]["type"][0] == "INTEGER"
+        assert schema["columns"]["pk"] == [1, 0, 0, 0, 0]
+        assert "cid" not in schema["columns"]
+        assert sorted(schema["foreign_keys"]["table"]) == ["orders", "products"]
+        assert set(schema["foreign_keys"]) == {"from", "table", "to"}
+        assert schema["indexes"] == {"name": [], "unique": [], "origin": []}
+
+    def test_sqlite_get_table_schema_cached_until_schema_changes(self, sample_db):
+        """Test a repeated schema lookup is served from the connection until the table is altered."""
+        first = sqlite_tools.sqlite_get_table_schema("products", database_path=sample_db)
+        with patch.object(sqlite_tools, "_fetch_columnar") as fetch_columnar:
+            second = sqlite_tools.sqlite_get_table_schema("products", database_path=sample_db)
+        fetch_columnar.assert_not_called()
+        assert second == first
+
+        # Each caller gets its own copy, so editing one result leaves the cached schema intact
+        second["columns"]["name"].append("scribbled")
+        first["column_count"] = 0
+        third = sqlite_tools.sqlite_get_table_schema("products", database_path=sample_db)
+        assert "scribbled" not in third["columns"]["name"]
+        assert third["column_count"] == len(third["columns"]["name"])
+
+        sqlite_tools.sqlite_execute_query("ALTER TABLE products ADD COLUMN sku TEXT", database_path=sample_db)
+        altered = sqlite_tools.sqlite_get_table_schema("products", database_path=sample_db)
+        assert altered["columns"]["name"][-1] == "sku"
+        assert altered["column_count"] == third["column_count"] + 1
+
+    def test_schema_tools_handle_quoted_table_names(self, sample_db):
+        """Test schema and listing tools bind or quote table names instead of interpolating them."""
+        sqlite_tools.sqlite_execute_query('CREATE TABLE "odd name" (id INTEGER PRIMARY KEY)', database_path=sample_db)
+
+        schema = sqlite_tools.sqlite_get_table_schema("odd name", database_path=sample_db)
+        assert schema["columns"]["name"] == ["id"]
+
+        schema = sqlite_tools.sqlite_get_table_schema("customers); DROP TABLE customers; --", database_path=sample_db)
+        assert schema["error"] == "Table 'customers); DROP TABLE customers; --' not found"
+
+        tables = {t["name"]: t["row_count"] for t in sqlite_tools.sqlite_list_tables(database_path=sample_db)["tables"]}
+        assert tables["odd name"] == 0
+        assert tables["customers"] == 5
+
+    @patch.object(sqlite_tools, "_MAX_COMPOUND_SELECT", 2)
+    def test_sqlite_list_tables_batches_row_counts(self, sample_db):
+        """Test row counts come back per table when the UNION ALL is split into chunks."""
+        result = sqlite_tools.sqlite_list_tables(database_path=sample_db)
+        counts = {t["name"]: t["row_count"] for t in result["tables"]}
+
+        assert counts["customers"] == 5
+        assert counts["products"] == 5
+        assert counts["orders"] == 5
+        assert counts["order_items"] == 8
+
+    def test_database_exists_check_cached(self, sample_db):
+        """Test existing database paths skip the stat() while missing ones are rechecked."""
+        missing = sample_db + ".missing"
+        with patch.object(sqlite_tools.os.path, "exists", wraps=os.path.exists) as mock_exists:
+            assert sqlite_tools.sqlite_list_tables(database_path=sample_db)["table_count"] > 0
+            assert sqlite_tools.sqlite_list_tables(database_path=sample_db)["table_count"] > 0
+            assert "not found" in sqlite_tools.sqlite_list_tables(database_path=missing)["error"]
+            assert "not found" in sqlite_tools.sqlite_list_tables(database_path=missing)["error"]
+
+        checked = [call.args[0] for call in mock_exists.call_args_list]
+        assert checked.count(sample_db) <= 1
+        assert checked.count(missing) == 2
+
+    def test_deleted_database_not_recreated(self, sample_db):
+        """Test a database deleted while its path is still cached fails instead of coming back empty."""
+        assert sqlite_tools.sqlite_list_tables(database_path=sample_db)["table_count"] > 0
+        sqlite_tools._pool.discard(sample_db)
+        os.remove(sample_db)
+
+        assert "error" in sqlite_tools.sqlite_list_tables(database_path=sample_db)
+        assert not os.path.exists(sample_db)
+        # The failed connect dropped the cached answer, so the next call reports the missing file
+        assert "not found" in sqlite_tools.sqlite_list_tables(database_path=sample_db)["error"]
+
+    def test_regexp_filtering_in_sql(self, sample_db):
+        """Test REGEXP is available so filtering happens inside the query."""
+        result = sqlite_tools.sqlite_execute_query(
+            "SELECT name FROM customers WHERE email REGEXP ? ORDER BY id",
+            database_path=sample_db,
+            parameters=["^[a-c]"],
+        )
+        assert result["rows"] == [["Alice Johnson"], ["Bob Smith"], ["Carol Davis"]]
+
+    def test_configured_extensions_loaded(self):
+        """Test configured extensions are loaded with extension loading switched off afterwards."""
+        conn = Mock()
+        with patch.object(sqlite_tools.Config, "SQLITE_EXTENSIONS", ["/opt/sqlean/sqlean"]):
+            sqlite_tools._register_functions(conn)
+
+        conn.load_extension.assert_called_once_with("/opt/sqlean/sqlean")
+        assert conn.enable_load_extension.call_args_list[-1].args == (False,)
+
+    def test_sqlite_connection_caching(self, sample_db):
+        """Test that a returned connection is reused by the next caller."""
+        with sqlite_tools.get_sqlite_connection(sample_db) as conn1:
+            assert conn1.execute("SELECT COUNT(*) FROM customers").fetchone()[0] == 5
+        with sqlite_tools.get_sqlite_connection(sample_db) as conn2:
+            assert conn2 is conn1
+
+    def test_connection_pool_is_bounded(self, sample_db):
+        """Test that the pool never hands the same connection to two callers and waits when exhausted."""
+        pool = sqlite_tools.SQLiteConnectionPool(size=2, timeout=0.05)
+        try:
+            with pool.acquire(sample_db) as conn1, pool.acquire(sample_db) as conn2:
+                assert conn1 is not conn2
+                with pytest.raises(sqlite3.OperationalError, match="Timed out"):
+                    with pool.acquire(sample_db):
+                        pass
+
+            # Both connections are back in the pool and get reused
+            with pool.acquire(sample_db) as conn3:
+                assert conn3 in (conn1, conn2)
+        finally:
+            pool.discard(sample_db)
+
+    def test_connection_pool_overflow(self, sample_db):
+        """Test that a busy pool opens short-lived extra connections up to max_overflow."""
+        pool = sqlite_tools.SQLiteConnectionPool(size=1, timeout=0.05, max_overflow=1)
+        try:
+            with pool.acquire(sample_db) as pooled, pool.acquire(sample_db) as extra:
+                assert extra is not pooled
+                assert pool.overflows == 1
+                with pytest.raises(sqlite3.OperationalError, match="Timed out"):
+                    with pool.acquire(sample_db):
+                        pass
+
+            # The overflow connection is closed on return; the pooled one is reused
+            with pytest.raises(sqlite3.ProgrammingError):
+                extra.execute("SELECT 1")
+            with pool.acquire(sample_db) as conn:
+                assert conn is pooled
+        finally:
+            pool.discard(sample_db)
+
+    def test_nested_connection_reuse(self, sample_db):
+        """Test nested checkouts for the same database share one connection."""
+        with sqlite_tools.get_sqlite_connection(sample_db) as outer:
+            with sqlite_tools.get_sqlite_connection(sample_db) as inner:
+                assert inner is outer
+
+        with sqlite_tools.get_sqlite_connection(sample_db) as first:
+            pass
+        with sqlite_tools.get_sqlite_connection(sample_db) as second:
+            assert second is first
+
+    def test_connection_pool_close_all(self, sample_db):
+        """Test close_all closes idle connections for every database."""
+        pool = sqlite_tools.SQLiteConnectionPool(size=2)
+        with pool.acquire(sample_db) as conn:
+            pass
+        pool.close_all()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_connection_returned_without_open_transaction(self, sample_db):
+        """Test that an uncommitted write is rolled back before the connection is reused."""
+        pool = sqlite_tools.SQLiteConnectionPool(size=1)
+        try:
+            with pool.acquire(sample_db) as conn:
+                conn.execute("DELETE FROM customers")
+                assert conn.in_transaction
+
+            with pool.acquire(sample_db) as conn:
+                assert not conn.in_transaction
+                assert conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0] == 5
+        finally:
+            pool.discard(sample_db)
+
+
 class TestSQLiteBestPractices:
     """Test SQLite best practices and documentation."""
 
-    def test_best_practices_file_exists(self):
+    def test_best_practices_file_exists(self, project_root):
         """Test that best practices documentation exists."""
-        from pathlib import Path
-
         # Get the path to the best practices file
-        current_dir = Path(__file__).parent.parent.parent
-        best_practices_path = current_dir / "src" / "service_name_mcp" / "sqlite_domain" / "best_practices.md"
+        best_practices_path = project_root / "src" / "service_name_mcp" / "sqlite_domain" / "best_practices.md"
 
         assert best_practices_path.exists(), "SQLite best practices file should exist"
 
@@ -189,34 +552,19 @@ class TestSQLiteBestPractices:
 class TestSQLiteIntegration:
     """Integration tests for SQLite domain."""
 
-    def test_mcp_tool_registration(self):
-        """Test that SQLite tools are properly registered with MCP."""
-        try:
-            # Import the tools module to trigger registration
-            from service_name_mcp.mcp_instance import mcp
-
-            # This test verifies that import doesn't fail
-            # The actual tool registration testing would require MCP framework testing
-            assert mcp is not None
-
-        except ImportError as e:
-            pytest.fail(f"Failed to register SQLite tools with MCP: {e}")
-
     @pytest.mark.integration
     def test_end_to_end_workflow(self, temp_db):
         """Test complete SQLite workflow."""
-        from service_name_mcp.sqlite_domain.sqlite_tools import execute_sql_query, get_schema_info, get_table_sample
-
         # 1. Get schema
-        schema = get_schema_info(database_path=temp_db)
+        schema = sqlite_tools.get_schema_info(database_path=temp_db)
         assert "tables" in schema
 
         # 2. Sample data from a table
-        sample = get_table_sample(table_name="users", database_path=temp_db)
+        sample = sqlite_tools.get_table_sample(table_name="users", database_path=temp_db)
         assert len(sample) > 0
 
         # 3. Execute analytical query
-        result = execute_sql_query(
+        result = sqlite_tools.execute_sql_query(
             query="""
                 SELECT u.name, COUNT(o.id) as order_count, SUM(o.amount) as total_spent
                 FROM users u